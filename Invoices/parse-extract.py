@@ -7,10 +7,20 @@ from typing import Optional
 from landingai_ade import LandingAIADE
 from landingai_ade.lib import pydantic_to_json_schema
 from pydantic import BaseModel, Field
-import fitz  # pymupdf
 
 DOCUMENT_PATH = "./wire-transfer.pdf"
 
+# Define the data schema for extraction using Pydantic
+# This schema specifies what information to extract from the document
+class Invoice(BaseModel):
+    description: str = Field(description="Invoice description")
+    amount: Decimal = Field(description="Invoice Total amount")
+    currency: Optional[str] = Field(default="USD", description="Currency code")
+
+# Convert the Pydantic model to a JSON schema once at import time
+# The extraction endpoint requires a JSON schema
+INVOICE_JSON_SCHEMA = pydantic_to_json_schema(Invoice)
+
 def main():
     """Main execution function."""
     # Setup logging
@@ -52,67 +62,62 @@ def main():
         logger.error(f"Failed to parse document: {e}")
         raise
 
-    # Log the different parts of the parse response for debugging
-    logger.info("--------RESPONSE-----------")
-    logger.info(response)
-    logger.info("--------RESPONSE.CHUNKS-----------")
-    logger.info(response.chunks)
-    logger.info("--------RESPONSE.MARKDOWN-----------")
-    logger.info(response.markdown)
-    logger.info("--------RESPONSE.METADATA-----------")
-    logger.info(response.metadata)
-    logger.info("--------RESPONSE.SPLITS-----------")
-    logger.info(response.splits)
-
-    # Define the data schema for extraction using Pydantic
-    # This schema specifies what information to extract from the document
-    class Invoice(BaseModel):
-        description: str = Field(description="Invoice description")
-        amount: Decimal = Field(description="Invoice Total amount")
-        currency: Optional[str] = Field(default="USD", description="Currency code")
-
-    # Convert the Pydantic model to a JSON schema
-    # The extraction endpoint requires a JSON schema
-    schema = pydantic_to_json_schema(Invoice)
+    # Log a summary of the parse response; the full objects are only rendered at
+    # DEBUG level, since repr() of every chunk is expensive on large documents
+    logger.info("Parsed document: %d chunks, %d characters of markdown", len(response.chunks), len(response.markdown))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("--------RESPONSE.CHUNKS-----------")
+        logger.debug("%s", response.chunks)
+        logger.debug("--------RESPONSE.MARKDOWN-----------")
+        logger.debug("%s", response.markdown)
+        logger.debug("--------RESPONSE.METADATA-----------")
+        logger.debug("%s", response.metadata)
+        logger.debug("--------RESPONSE.SPLITS-----------")
+        logger.debug("%s", response.splits)
 
     # Call the extract method with the generated markdown from the parse step
     # The markdown content is passed as a bytes object
+    markdown_bytes = response.markdown.encode("utf-8")
     try:
         extract_response = client.extract(
-            schema=schema,
+            schema=INVOICE_JSON_SCHEMA,
             # support markdown as File or markdown_url as local path/remote url
-            markdown=io.BytesIO(response.markdown.encode("utf-8")),
+            markdown=io.BytesIO(markdown_bytes),
         )
     except Exception as e:
         logger.error(f"Failed to extract data: {e}")
         raise
 
-    # Log the different parts of the extraction response for debugging
-    logger.info("--------EXTRACTION RESPONSE-----------")
-    logger.info(extract_response)
-    logger.info("--------EXTRACTION RESPONSE.EXTRACTION-----------")
-    logger.info(extract_response.extraction)
-    logger.info("--------EXTRACTION RESPONSE.EXTRACTION_METADATA-----------")
-    logger.info(extract_response.extraction_metadata)
-    logger.info("--------EXTRACTION RESPONSE.METADATA-----------")
-    logger.info(extract_response.metadata)
-
-    # Get number of pages in the document
-    try:
-        with fitz.open(DOCUMENT_PATH) as doc:
-            logger.info(f"Number of pages in {DOCUMENT_PATH}: {len(doc)} and it would cost {3 * len(doc)}")
-    except Exception as e:
-        logger.error(f"Failed to read PDF: {e}")
-        raise
+    # Log a summary of the extraction response; full objects only at DEBUG level
+    logger.info("Extracted %d top-level fields", len(extract_response.extraction))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("--------EXTRACTION RESPONSE.EXTRACTION-----------")
+        logger.debug("%s", extract_response.extraction)
+        logger.debug("--------EXTRACTION RESPONSE.EXTRACTION_METADATA-----------")
+        logger.debug("%s", extract_response.extraction_metadata)
+        logger.debug("--------EXTRACTION RESPONSE.METADATA-----------")
+        logger.debug("%s", extract_response.metadata)
+
+    # Get number of pages in the document from the parse response, so the PDF
+    # doesn't have to be opened a second time
+    num_pages = getattr(response.metadata, "page_count", None)
+    if num_pages is None and response.chunks:
+        num_pages = len({c.grounding.page for c in response.chunks if getattr(c, "grounding", None)}) or None
+    if num_pages is None:
+        logger.warning(f"Number of pages in {DOCUMENT_PATH} not reported by the parse response")
+    else:
+        logger.info(f"Number of pages in {DOCUMENT_PATH}: {num_pages} and it would cost {3 * num_pages}")
 
     # Count and log the number of characters in response.markdown
     num_chars_markdown = len(response.markdown)
-    logger.info(f"Number of characters in response.markdown: {num_chars_markdown} and it would cost {round(num_chars_markdown/5000,1)}")
+    markdown_cost = round(num_chars_markdown / 5000, 1)
+    logger.info(f"Number of characters in response.markdown: {num_chars_markdown} and it would cost {markdown_cost}")
     # Count and log the number of characters in extract_response
+    # (extraction is a plain dict, so str() is a cheap dict repr, not a model repr)
     num_chars_extract_response = len(str(extract_response.extraction))
-    logger.info(f"Number of characters in extract_response: {num_chars_extract_response} and it would cost {round(num_chars_extract_response/1000,1)}")
-    logger.info(f"Total Extraction cost is {round(round(num_chars_markdown/5000,1)+round(num_chars_extract_response/1000,1),1)}")
-
+    extract_cost = round(num_chars_extract_response / 1000, 1)
+    logger.info(f"Number of characters in extract_response: {num_chars_extract_response} and it would cost {extract_cost}")
+    logger.info(f"Total Extraction cost is {round(markdown_cost + extract_cost, 1)}")
 
 if __name__ == "__main__":
     main()
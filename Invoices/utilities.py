@@ -1,9 +1,18 @@
 
 from pathlib import Path
+import os
+import asyncio
 import json
 import io
 import uuid
+import functools
+import threading
+import numpy as np
 import pandas as pd
+from typing import List
+from pydantic import TypeAdapter
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Method 1: Environment variable
@@ -30,6 +39,41 @@ def get_api_key_env() -> str:
     settings = Settings()
     return settings.vision_agent_api_key
 
+def _write_json(results, json_path) -> None:
+    """
+    Serialize an ADE result object (or plain dict) to an indented JSON file.
+
+    Pydantic models are serialized straight to UTF-8 JSON bytes by pydantic-core
+    (the serializer behind `model_dump_json()`), without building an intermediate
+    Python dict or decoding to str and re-encoding.
+    """
+    if hasattr(results, "__pydantic_serializer__"):
+        data = results.__pydantic_serializer__.to_json(results, indent=2)
+    else:
+        # fallback if it's a plain dict-like object
+        data = json.dumps(results, indent=2, default=str).encode("utf-8")
+
+    _atomic_write(json_path, data)
+
+def _atomic_write(path, data: bytes) -> None:
+    """
+    Write bytes to `path` via a temporary file in the same directory and os.replace,
+    so readers never see a partially written file.
+    """
+    path = Path(path)
+    # Unique per writing thread, so concurrent writes to the same path can't collide
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+# Background writer for parse JSON, so the write overlaps with the extract API call
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ade-write")
+
 def save_parse_results(results, output_dir: str = "./ade_results") -> None:
     """
     Save ADE parse results to disk.
@@ -41,7 +85,7 @@ def save_parse_results(results, output_dir: str = "./ade_results") -> None:
 
     Args:
         results: The ADE parse results object returned by the parse() call.
-                 Must have `metadata.filename` and `model_dump()` attributes.
+                 Must have `metadata.filename` and be a Pydantic model (or a plain dict).
         output_dir (str, optional): Directory where the JSON file will be saved.
                                    Defaults to "./ade_results".
 
@@ -53,17 +97,10 @@ def save_parse_results(results, output_dir: str = "./ade_results") -> None:
     parse_filename = getattr(getattr(results, "metadata", {}), "filename", "unknown_filename")
     base_filename = f"parse_{Path(parse_filename).stem}"
 
-    # Dump results as JSON
-    if hasattr(results, "model_dump"):
-        results_json = json.dumps(results.model_dump(), indent=2, default=str)
-    else:
-        # fallback if it's a plain dict-like object
-        results_json = json.dumps(results, indent=2, default=str)
-
     json_path = output_path / f"{base_filename}.json"
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        f.write(results_json)
+    # Dump results as JSON
+    _write_json(results, json_path)
 
     print(f"Parse results saved to: {json_path}")
 
@@ -112,6 +149,13 @@ def parse_and_save(document_path, client, output_dir: str = "./ade_results"):
 
     return parse_result
 
+@functools.lru_cache(maxsize=None)
+def _json_schema_for(schema_class):
+    """Convert a Pydantic schema class to the JSON schema used by extract, once per class."""
+    from landingai_ade.lib import pydantic_to_json_schema
+
+    return pydantic_to_json_schema(schema_class)
+
 def parse_extract_save(document_path, client, schema_class, output_dir: str = "./ade_results"):
     """
     Parse a document, extract structured data using a Pydantic schema, and save both results as JSON.
@@ -152,8 +196,6 @@ def parse_extract_save(document_path, client, schema_class, output_dir: str = ".
         >>> # Results saved as: parse_my_doc.json and extract_my_doc.json
         >>> print(f"Extracted: {extract_result.extraction}")
     """
-    from landingai_ade.lib import pydantic_to_json_schema
-
     # Convert to Path object
     doc_path = Path(document_path)
 
@@ -161,6 +203,10 @@ def parse_extract_save(document_path, client, schema_class, output_dir: str = ".
     if not doc_path.exists():
         raise FileNotFoundError(f"Document not found: {document_path}")
 
+    return _parse_extract_save(doc_path, client, schema_class, output_dir)
+
+def _parse_extract_save(doc_path, client, schema_class, output_dir):
+    """parse_extract_save without the existence check, for paths already validated."""
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
@@ -171,40 +217,250 @@ def parse_extract_save(document_path, client, schema_class, output_dir: str = ".
     # STEP 1: Parse the document
     parse_result = client.parse(document=doc_path)
 
-    # Save parse result
+    # Save parse result in the background while the extract call is in flight
     parse_json_path = output_path / f"parse_{base_filename}.json"
-    if hasattr(parse_result, "model_dump"):
-        parse_json = json.dumps(parse_result.model_dump(), indent=2, default=str)
-    else:
-        parse_json = json.dumps(parse_result, indent=2, default=str)
-
-    with open(parse_json_path, "w", encoding="utf-8") as f:
-        f.write(parse_json)
-    print(f"Parse results saved to: {parse_json_path}")
+    parse_write = _WRITE_POOL.submit(_write_json, parse_result, parse_json_path)
 
     # STEP 2: Extract structured data using the schema
-    # Convert Pydantic schema to JSON schema
-    json_schema = pydantic_to_json_schema(schema_class)
+    # Convert Pydantic schema to JSON schema (cached per schema class)
+    json_schema = _json_schema_for(schema_class)
 
-    # Call extract with markdown from parse result
+    # Call extract with markdown from parse result, encoded once
+    markdown_bytes = parse_result.markdown.encode("utf-8")
     extract_result = client.extract(
         schema=json_schema,
-        markdown=io.BytesIO(parse_result.markdown.encode("utf-8"))
+        markdown=io.BytesIO(markdown_bytes)
     )
 
-    # Save extract result
-    extract_json_path = output_path / f"extract_{base_filename}.json"
-    if hasattr(extract_result, "model_dump"):
-        extract_json = json.dumps(extract_result.model_dump(), indent=2, default=str)
-    else:
-        extract_json = json.dumps(extract_result, indent=2, default=str)
+    # Wait for the parse write so the file exists on return and write errors surface here
+    parse_write.result()
+    print(f"Parse results saved to: {parse_json_path}")
 
-    with open(extract_json_path, "w", encoding="utf-8") as f:
-        f.write(extract_json)
+    # Save extract result (nothing left to overlap with, so write it inline)
+    extract_json_path = output_path / f"extract_{base_filename}.json"
+    _write_json(extract_result, extract_json_path)
     print(f"Extract results saved to: {extract_json_path}")
 
     return parse_result, extract_result
 
+def _validate_paths(document_paths):
+    """
+    Check that every document exists with one directory listing per parent folder,
+    instead of a stat() call per file. Only regular files (or symlinks to them) pass;
+    broken symlinks and directories are reported as missing.
+
+    Returns:
+        list: The paths as Path objects, in input order.
+
+    Raises:
+        FileNotFoundError: Listing every path that does not exist.
+    """
+    paths = [Path(p) for p in document_paths]
+
+    names_by_dir = defaultdict(set)
+    for path in paths:
+        names_by_dir[path.parent].add(path.name)
+
+    existing = {}
+    for directory in names_by_dir:
+        try:
+            with os.scandir(directory) as entries:
+                # is_file() follows symlinks, so broken links and subdirectories don't count
+                existing[directory] = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            # Missing, unreadable, or not a directory: none of its documents can be read
+            existing[directory] = set()
+
+    missing = [str(p) for p in paths if p.name not in existing[p.parent]]
+    if missing:
+        raise FileNotFoundError(f"Documents not found: {missing}")
+
+    return paths
+
+def batch_parse_extract(document_paths, client, schema_class, output_dir: str = "./ade_results", max_workers: int = 16):
+    """
+    Run parse_extract_save over many documents in parallel on a thread pool.
+
+    The work is dominated by API round-trips, so threads let up to `max_workers`
+    documents wait on the network at the same time. Failed documents are reported
+    and skipped so one bad file does not abort the batch.
+
+    Args:
+        document_paths (list of str or Path): Paths to the documents to process.
+        client (LandingAIADE): An initialized LandingAI ADE client instance.
+        schema_class (BaseModel): A Pydantic model class defining the extraction schema.
+        output_dir (str, optional): Directory where JSON files will be saved.
+                                   Defaults to "./ade_results".
+        max_workers (int, optional): Number of worker threads. Keep within your ADE
+                                     rate limits. Defaults to 16.
+
+    Returns:
+        list: (parse_result, extract_result) tuples for the documents that succeeded,
+              in completion order. Ready to pass to create_invoice_summary_tables().
+
+    Raises:
+        FileNotFoundError: If any of the documents do not exist (checked before any API call).
+
+    Example:
+        >>> results_summary = batch_parse_extract(file_paths, client, InvoiceExtractionSchema, "./results")
+        >>> invoice_summaries = create_invoice_summary_tables(results_summary)
+    """
+    document_paths = _validate_paths(document_paths)
+
+    results_summary = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_parse_extract_save, p, client, schema_class, output_dir): p
+            for p in document_paths
+        }
+        for future in as_completed(futures):
+            try:
+                results_summary.append(future.result())
+            except Exception as e:
+                print(f"❌ {Path(futures[future]).name} failed: {e}")
+
+    return results_summary
+
+async def parse_extract_save_async(document_paths, client, schema_class, output_dir: str = "./ade_results", concurrency: int = 16):
+    """
+    Run parse_extract_save over many documents with their API calls in flight concurrently.
+
+    Each document is handled by parse_extract_save on a worker thread, so its extract
+    request fires as soon as its own parse returns instead of waiting for the rest of
+    the batch. A thread pool of `concurrency` workers caps the number of documents in
+    flight at once to stay within ADE rate limits.
+
+    Args:
+        document_paths (list of str or Path): Paths to the documents to process.
+        client (LandingAIADE): An initialized LandingAI ADE client instance.
+        schema_class (BaseModel): A Pydantic model class defining the extraction schema.
+        output_dir (str, optional): Directory where JSON files will be saved.
+                                   Defaults to "./ade_results".
+        concurrency (int, optional): Maximum number of documents in flight. Defaults to 16.
+
+    Returns:
+        list: (parse_result, extract_result) tuples for the documents that succeeded,
+              in input order. Ready to pass to create_invoice_summary_tables().
+
+    Raises:
+        FileNotFoundError: If any of the documents do not exist (checked before any API call).
+
+    Example:
+        >>> import asyncio
+        >>> results_summary = asyncio.run(
+        ...     parse_extract_save_async(file_paths, client, InvoiceExtractionSchema, "./results")
+        ... )
+        >>> # In Jupyter, where an event loop is already running:
+        >>> results_summary = await parse_extract_save_async(file_paths, client, InvoiceExtractionSchema)
+    """
+    document_paths = _validate_paths(document_paths)
+
+    # A dedicated pool sized to `concurrency`: the loop's default executor is capped
+    # by CPU count and would silently limit how many documents are in flight
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        tasks = [
+            loop.run_in_executor(executor, _parse_extract_save, p, client, schema_class, output_dir)
+            for p in document_paths
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        executor.shutdown(wait=False)
+
+    results_summary = []
+    for path, outcome in zip(document_paths, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"❌ {Path(path).name} failed: {outcome}")
+        else:
+            results_summary.append(outcome)
+
+    return results_summary
+
+# INVOICES_MAIN columns flattened from the nested extraction: (column, section, field)
+_INVOICE_MAIN_FIELDS = (
+    # DocumentInfo fields
+    ('INVOICE_DATE_RAW', 'invoice_info', 'invoice_date_raw'),
+    ('INVOICE_DATE', 'invoice_info', 'invoice_date'),
+    ('INVOICE_NUMBER', 'invoice_info', 'invoice_number'),
+    ('ORDER_DATE', 'invoice_info', 'order_date'),
+    ('PO_NUMBER', 'invoice_info', 'po_number'),
+    ('STATUS', 'invoice_info', 'status'),
+
+    # CustomerInfo fields
+    ('SOLD_TO_NAME', 'customer_info', 'sold_to_name'),
+    ('SOLD_TO_ADDRESS', 'customer_info', 'sold_to_address'),
+    ('CUSTOMER_EMAIL', 'customer_info', 'customer_email'),
+
+    # SupplierInfo fields
+    ('SUPPLIER_NAME', 'company_info', 'supplier_name'),
+    ('SUPPLIER_ADDRESS', 'company_info', 'supplier_address'),
+    ('REPRESENTATIVE', 'company_info', 'representative'),
+    ('EMAIL', 'company_info', 'email'),
+    ('PHONE', 'company_info', 'phone'),
+    ('GSTIN', 'company_info', 'gstin'),
+    ('PAN', 'company_info', 'pan'),
+
+    # TermsAndShipping fields
+    ('PAYMENT_TERMS', 'order_details', 'payment_terms'),
+    ('SHIP_VIA', 'order_details', 'ship_via'),
+    ('SHIP_DATE', 'order_details', 'ship_date'),
+    ('TRACKING_NUMBER', 'order_details', 'tracking_number'),
+
+    # TotalsSummary fields
+    ('CURRENCY', 'totals_summary', 'currency'),
+    ('TOTAL_DUE_RAW', 'totals_summary', 'total_due_raw'),
+    ('TOTAL_DUE', 'totals_summary', 'total_due'),
+    ('SUBTOTAL', 'totals_summary', 'subtotal'),
+    ('TAX', 'totals_summary', 'tax'),
+    ('SHIPPING', 'totals_summary', 'shipping'),
+    ('HANDLING_FEE', 'totals_summary', 'handling_fee'),
+)
+
+@functools.lru_cache(maxsize=32)
+def _make_flattener(field_map):
+    """
+    Generate a straight-line function that flattens one extraction dict into columns.
+
+    The returned `flatten(extraction, columns)` fetches each section of the extraction
+    once and appends every field to the matching list in `columns` (same order as
+    `field_map`), without walking the key path again for every field. A missing or
+    non-dict section yields None for all of its fields.
+    """
+    lines = ["def flatten(extraction, columns):"]
+    section_vars = {}
+    for i, (_, section, field) in enumerate(field_map):
+        if section not in section_vars:
+            var = section_vars[section] = f"s{len(section_vars)}"
+            lines.append(f"    {var} = extraction.get({section!r})")
+            lines.append(f"    if not isinstance({var}, dict): {var} = {{}}")
+        lines.append(f"    columns[{i}].append({section_vars[section]}.get({field!r}))")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["flatten"]
+
+# Packed record layout for PARSED_CHUNKS grounding boxes: coordinates and page
+_CHUNK_BOX_DTYPE = np.dtype([('l', 'f4'), ('t', 'f4'), ('r', 'f4'), ('b', 'f4'), ('page', 'i4')])
+
+# Chunk fields read into PARSED_CHUNKS, in pydantic include= form
+_CHUNK_DUMP_INCLUDE = {'__all__': {'id': True, 'type': True, 'markdown': True, 'grounding': {'box', 'page'}}}
+
+# TypeAdapter(list[ChunkClass]) per chunk class, built on first use
+_CHUNK_ADAPTERS = {}
+
+def _dump_chunks(chunks):
+    """Serialize a list of parsed chunks to plain dicts with a cached TypeAdapter."""
+    if not chunks:
+        return []
+
+    chunk_class = type(chunks[0])
+    adapter = _CHUNK_ADAPTERS.get(chunk_class)
+    if adapter is None:
+        adapter = _CHUNK_ADAPTERS[chunk_class] = TypeAdapter(List[chunk_class])
+
+    return adapter.dump_python(chunks, mode='python', include=_CHUNK_DUMP_INCLUDE)
+
 def create_invoice_summary_tables(results, extract_result=None, run_id=None):
     """
     Create 4 pandas DataFrames matching the Snowflake table structure from ADE parse and extract results.
@@ -226,6 +482,16 @@ def create_invoice_summary_tables(results, extract_result=None, run_id=None):
                  - A list of (parse_result, extract_result) tuples (batch mode)
         extract_result: The ExtractResponse object (only for single document mode, ignored in batch mode)
         run_id (str, optional): Identifier for the processing batch/run. Defaults to generated UUID.
+                                INVOICE_UUIDs are derived from run_id and the document name,
+                                so re-running with the same run_id reproduces the same IDs.
+                                Only pass the same run_id to two calls when they cover the
+                                same documents (e.g. a retry): two calls that share a run_id
+                                and contain documents with the same filename (such as
+                                invoice_1.pdf in input_folder and input_folder2) produce
+                                identical INVOICE_UUIDs. Snowflake does not enforce the
+                                INVOICE_UUID primary key, so such duplicates load silently.
+                                Leave run_id as None, or use a distinct run_id per call,
+                                for separate batches.
 
     Returns:
         list: invoice_summaries - List of 4 pandas DataFrames:
@@ -265,148 +531,197 @@ def create_invoice_summary_tables(results, extract_result=None, run_id=None):
     if run_id is None:
         run_id = str(uuid.uuid4())
 
-    # Initialize lists to accumulate data across all documents
-    markdown_rows = []
-    chunks_rows = []
-    main_rows = []
-    line_items_rows = []
+    # Invoice UUIDs are name-based (uuid5) within a namespace derived from the run:
+    # a pure in-process hash per document instead of a urandom read for each one
+    run_namespace = uuid.uuid5(uuid.NAMESPACE_OID, run_id)
+    name_counts = {}
+
+    # Accumulate each table column-wise: one list per output column, so no
+    # per-row dict is built and pandas doesn't have to re-infer the schema
+    md_run, md_uuid, md_doc, md_ver, md_markdown = ([] for _ in range(5))
+    c_run, c_uuid, c_doc, c_chunk_id, c_type, c_text = ([] for _ in range(6))
+    c_boxes = []  # one _CHUNK_BOX_DTYPE array per document
+    li_run, li_uuid, li_doc, li_ver, li_index = ([] for _ in range(5))
+    li_line_number, li_sku, li_description, li_quantity = ([] for _ in range(4))
+    li_unit_price, li_price, li_amount, li_total = ([] for _ in range(4))
+    main_cols = {
+        column: [] for column in ('RUN_ID', 'INVOICE_UUID', 'DOCUMENT_NAME', 'AGENTIC_DOC_VERSION')
+    }
+    main_cols.update((column, []) for column, _, _ in _INVOICE_MAIN_FIELDS)
+    flatten_main = _make_flattener(_INVOICE_MAIN_FIELDS)
+    main_field_cols = [main_cols[column] for column, _, _ in _INVOICE_MAIN_FIELDS]
 
     # Process each document
     for parse_result, extract_result in results_list:
-        # Generate unique invoice UUID for this document
-        invoice_uuid = str(uuid.uuid4())
-
         # Extract metadata from parse result
         document_name = parse_result.metadata.filename if hasattr(parse_result.metadata, 'filename') else 'unknown'
         agentic_doc_version = parse_result.metadata.version if hasattr(parse_result.metadata, 'version') else 'unknown'
 
+        # Generate unique invoice UUID for this document (documents sharing a
+        # filename within the batch are told apart by their occurrence number)
+        occurrence = name_counts[document_name] = name_counts.get(document_name, -1) + 1
+        invoice_uuid = str(uuid.uuid5(run_namespace, f"{document_name}#{occurrence}"))
+
         # ====================
         # TABLE 1: MARKDOWN
         # ====================
-        markdown_rows.append({
-            'RUN_ID': run_id,
-            'INVOICE_UUID': invoice_uuid,
-            'DOCUMENT_NAME': document_name,
-            'AGENTIC_DOC_VERSION': agentic_doc_version,
-            'MARKDOWN': parse_result.markdown
-        })
+        md_run.append(run_id)
+        md_uuid.append(invoice_uuid)
+        md_doc.append(document_name)
+        md_ver.append(agentic_doc_version)
+        md_markdown.append(parse_result.markdown)
 
         # ====================
         # TABLE 2: PARSED_CHUNKS
         # ====================
-        for chunk in parse_result.chunks:
+        # Dump all chunks to plain dicts in one pydantic-core call (only the fields
+        # this table needs) and read them with dict.get, rather than probing every
+        # attribute of every chunk with hasattr()
+        chunks = _dump_chunks(parse_result.chunks)
+
+        # Grounding boxes and pages go into a packed numpy record array
+        # (missing coordinates become NaN, a missing page becomes -1)
+        boxes = np.empty(len(chunks), dtype=_CHUNK_BOX_DTYPE)
+
+        for i, chunk in enumerate(chunks):
             # Extract grounding box coordinates
-            grounding = chunk.grounding if hasattr(chunk, 'grounding') else None
-            box = grounding.box if grounding and hasattr(grounding, 'box') else None
-            page = grounding.page if grounding and hasattr(grounding, 'page') else None
-
-            # Extract text from markdown (remove anchor tags and special markup)
-            text = chunk.markdown if hasattr(chunk, 'markdown') else ''
-
-            chunks_rows.append({
-                'RUN_ID': run_id,
-                'INVOICE_UUID': invoice_uuid,
-                'DOCUMENT_NAME': document_name,
-                'chunk_id': chunk.id if hasattr(chunk, 'id') else None,
-                'chunk_type': chunk.type if hasattr(chunk, 'type') else None,
-                'text': text,
-                'page': page,
-                'box_l': box.left if box and hasattr(box, 'left') else None,
-                'box_t': box.top if box and hasattr(box, 'top') else None,
-                'box_r': box.right if box and hasattr(box, 'right') else None,
-                'box_b': box.bottom if box and hasattr(box, 'bottom') else None
-            })
+            grounding = chunk.get('grounding') or {}
+            box = grounding.get('box') or {}
+            page = grounding.get('page')
+            boxes[i] = (box.get('left'), box.get('top'), box.get('right'), box.get('bottom'),
+                        -1 if page is None else page)
+
+            c_run.append(run_id)
+            c_uuid.append(invoice_uuid)
+            c_doc.append(document_name)
+            c_chunk_id.append(chunk.get('id'))
+            c_type.append(chunk.get('type'))
+            c_text.append(chunk.get('markdown', ''))
+
+        c_boxes.append(boxes)
 
         # ====================
         # TABLE 3: INVOICES_MAIN
         # ====================
         extraction = extract_result.extraction if hasattr(extract_result, 'extraction') else {}
+        if not isinstance(extraction, dict):
+            extraction = {}
 
-        # Helper to safely get nested dict values
-        def safe_get(d, *keys):
-            for key in keys:
-                if isinstance(d, dict) and key in d:
-                    d = d[key]
-                else:
-                    return None
-            return d
+        main_cols['RUN_ID'].append(run_id)
+        main_cols['INVOICE_UUID'].append(invoice_uuid)
+        main_cols['DOCUMENT_NAME'].append(document_name)
+        main_cols['AGENTIC_DOC_VERSION'].append(agentic_doc_version)
 
         # Flatten all fields from the nested extraction schema
-        main_data = {
-            'RUN_ID': run_id,
-            'INVOICE_UUID': invoice_uuid,
-            'DOCUMENT_NAME': document_name,
-            'AGENTIC_DOC_VERSION': agentic_doc_version,
-
-            # DocumentInfo fields
-            'INVOICE_DATE_RAW': safe_get(extraction, 'invoice_info', 'invoice_date_raw'),
-            'INVOICE_DATE': safe_get(extraction, 'invoice_info', 'invoice_date'),
-            'INVOICE_NUMBER': safe_get(extraction, 'invoice_info', 'invoice_number'),
-            'ORDER_DATE': safe_get(extraction, 'invoice_info', 'order_date'),
-            'PO_NUMBER': safe_get(extraction, 'invoice_info', 'po_number'),
-            'STATUS': safe_get(extraction, 'invoice_info', 'status'),
-
-            # CustomerInfo fields
-            'SOLD_TO_NAME': safe_get(extraction, 'customer_info', 'sold_to_name'),
-            'SOLD_TO_ADDRESS': safe_get(extraction, 'customer_info', 'sold_to_address'),
-            'CUSTOMER_EMAIL': safe_get(extraction, 'customer_info', 'customer_email'),
-
-            # SupplierInfo fields
-            'SUPPLIER_NAME': safe_get(extraction, 'company_info', 'supplier_name'),
-            'SUPPLIER_ADDRESS': safe_get(extraction, 'company_info', 'supplier_address'),
-            'REPRESENTATIVE': safe_get(extraction, 'company_info', 'representative'),
-            'EMAIL': safe_get(extraction, 'company_info', 'email'),
-            'PHONE': safe_get(extraction, 'company_info', 'phone'),
-            'GSTIN': safe_get(extraction, 'company_info', 'gstin'),
-            'PAN': safe_get(extraction, 'company_info', 'pan'),
-
-            # TermsAndShipping fields
-            'PAYMENT_TERMS': safe_get(extraction, 'order_details', 'payment_terms'),
-            'SHIP_VIA': safe_get(extraction, 'order_details', 'ship_via'),
-            'SHIP_DATE': safe_get(extraction, 'order_details', 'ship_date'),
-            'TRACKING_NUMBER': safe_get(extraction, 'order_details', 'tracking_number'),
-
-            # TotalsSummary fields
-            'CURRENCY': safe_get(extraction, 'totals_summary', 'currency'),
-            'TOTAL_DUE_RAW': safe_get(extraction, 'totals_summary', 'total_due_raw'),
-            'TOTAL_DUE': safe_get(extraction, 'totals_summary', 'total_due'),
-            'SUBTOTAL': safe_get(extraction, 'totals_summary', 'subtotal'),
-            'TAX': safe_get(extraction, 'totals_summary', 'tax'),
-            'SHIPPING': safe_get(extraction, 'totals_summary', 'shipping'),
-            'HANDLING_FEE': safe_get(extraction, 'totals_summary', 'handling_fee'),
-        }
-
-        main_rows.append(main_data)
+        flatten_main(extraction, main_field_cols)
 
         # ====================
         # TABLE 4: INVOICE_LINE_ITEMS
         # ====================
-        line_items = safe_get(extraction, 'line_items') or []
+        line_items = extraction.get('line_items') or []
 
         for idx, item in enumerate(line_items):
-            line_items_rows.append({
-                'RUN_ID': run_id,
-                'INVOICE_UUID': invoice_uuid,
-                'DOCUMENT_NAME': document_name,
-                'AGENTIC_DOC_VERSION': agentic_doc_version,
-                'LINE_INDEX': idx,
-                'LINE_NUMBER': item.get('line_number') if isinstance(item, dict) else getattr(item, 'line_number', None),
-                'SKU': item.get('sku') if isinstance(item, dict) else getattr(item, 'sku', None),
-                'DESCRIPTION': item.get('description') if isinstance(item, dict) else getattr(item, 'description', None),
-                'QUANTITY': item.get('quantity') if isinstance(item, dict) else getattr(item, 'quantity', None),
-                'UNIT_PRICE': item.get('unit_price') if isinstance(item, dict) else getattr(item, 'unit_price', None),
-                'PRICE': item.get('price') if isinstance(item, dict) else getattr(item, 'price', None),
-                'AMOUNT': item.get('amount') if isinstance(item, dict) else getattr(item, 'amount', None),
-                'TOTAL': item.get('total') if isinstance(item, dict) else getattr(item, 'total', None),
-            })
-
-    # Convert accumulated rows to DataFrames
-    markdown_df = pd.DataFrame(markdown_rows)
-    chunks_df = pd.DataFrame(chunks_rows)
-    main_df = pd.DataFrame(main_rows)
-    line_items_df = pd.DataFrame(line_items_rows)
+            # Pick the field accessor once per item rather than once per field
+            if isinstance(item, dict):
+                get = item.get
+            else:
+                get = lambda key, _item=item: getattr(_item, key, None)
+
+            li_run.append(run_id)
+            li_uuid.append(invoice_uuid)
+            li_doc.append(document_name)
+            li_ver.append(agentic_doc_version)
+            li_index.append(idx)
+            li_line_number.append(get('line_number'))
+            li_sku.append(get('sku'))
+            li_description.append(get('description'))
+            li_quantity.append(get('quantity'))
+            li_unit_price.append(get('unit_price'))
+            li_price.append(get('price'))
+            li_amount.append(get('amount'))
+            li_total.append(get('total'))
+
+    # Convert accumulated columns to DataFrames
+    markdown_df = pd.DataFrame({
+        'RUN_ID': md_run,
+        'INVOICE_UUID': md_uuid,
+        'DOCUMENT_NAME': md_doc,
+        'AGENTIC_DOC_VERSION': md_ver,
+        'MARKDOWN': md_markdown,
+    })
+    boxes = np.concatenate(c_boxes) if c_boxes else np.empty(0, dtype=_CHUNK_BOX_DTYPE)
+    chunks_df = pd.DataFrame({
+        'RUN_ID': c_run,
+        'INVOICE_UUID': c_uuid,
+        'DOCUMENT_NAME': c_doc,
+        'chunk_id': c_chunk_id,
+        'chunk_type': c_type,
+        'text': c_text,
+        'page': pd.arrays.IntegerArray(boxes['page'], boxes['page'] < 0),
+        'box_l': boxes['l'],
+        'box_t': boxes['t'],
+        'box_r': boxes['r'],
+        'box_b': boxes['b'],
+    }, copy=False)
+    main_df = pd.DataFrame(main_cols, copy=False)
+    line_items_df = pd.DataFrame({
+        'RUN_ID': li_run,
+        'INVOICE_UUID': li_uuid,
+        'DOCUMENT_NAME': li_doc,
+        'AGENTIC_DOC_VERSION': li_ver,
+        'LINE_INDEX': li_index,
+        'LINE_NUMBER': li_line_number,
+        'SKU': li_sku,
+        'DESCRIPTION': li_description,
+        'QUANTITY': li_quantity,
+        'UNIT_PRICE': li_unit_price,
+        'PRICE': li_price,
+        'AMOUNT': li_amount,
+        'TOTAL': li_total,
+    }, copy=False).astype({'LINE_INDEX': 'int32'})
 
     # Return all 4 tables as a list
     invoice_summaries = [markdown_df, chunks_df, main_df, line_items_df]
 
-    return invoice_summaries
\ No newline at end of file
+    return invoice_summaries
+
+def save_summaries_parquet(invoice_summaries, output_dir: str = "./ade_results", run_id=None):
+    """
+    Save the 4 summary DataFrames as zstd-compressed Parquet files for Snowflake loading.
+
+    Parquet is columnar and much smaller than the JSON results, and Snowflake loads it
+    with `COPY INTO ... FILE_FORMAT = (TYPE = PARQUET)`. Requires `pyarrow`.
+
+    Args:
+        invoice_summaries (list): The 4 DataFrames returned by create_invoice_summary_tables().
+        output_dir (str, optional): Directory where the Parquet files will be saved.
+                                   Defaults to "./ade_results".
+        run_id (str, optional): Run identifier used in the filenames. Defaults to the
+                                RUN_ID found in the DataFrames.
+
+    Returns:
+        list: Paths of the 4 files written: markdown_{run_id}.parquet,
+              chunks_{run_id}.parquet, main_{run_id}.parquet, line_items_{run_id}.parquet
+
+    Example:
+        >>> invoice_summaries = create_invoice_summary_tables(results_summary)
+        >>> save_summaries_parquet(invoice_summaries, output_dir="./results_folder")
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if run_id is None:
+        markdown_df = invoice_summaries[0]
+        run_id = markdown_df['RUN_ID'].iloc[0] if len(markdown_df) else "empty"
+
+    parquet_paths = []
+    for table_name, df in zip(("markdown", "chunks", "main", "line_items"), invoice_summaries):
+        parquet_path = output_path / f"{table_name}_{run_id}.parquet"
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), parquet_path, compression="zstd")
+        print(f"Saved {len(df)} rows to: {parquet_path}")
+        parquet_paths.append(parquet_path)
+
+    return parquet_paths